@@ -10,6 +10,8 @@ empty = inspect.Signature.empty
 class AnnotatedObject:
     """A helper class to store information about an annotated object."""
 
+    __slots__ = ("annotation", "description")
+
     def __init__(self, annotation: Any, description: str) -> None:
         """
         Initialize the object.
@@ -25,6 +27,8 @@ class AnnotatedObject:
 class Attribute(AnnotatedObject):
     """A helper class to store information about a documented attribute."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str, annotation: Any, description: str) -> None:
         """
         Initialize the object.
@@ -41,6 +45,8 @@ class Attribute(AnnotatedObject):
 class Parameter(AnnotatedObject):
     """A helper class to store information about a signature parameter."""
 
+    __slots__ = ("name", "kind", "default")
+
     def __init__(self, name: str, annotation: Any, description: str, kind: Any, default: Any = empty) -> None:
         """
         Initialize the object.
@@ -160,13 +166,17 @@ class Parser(metaclass=ABCMeta):
         errors = self.errors
         return sections, errors
 
-    def error(self, message) -> None:
+    def error(self, message, *args) -> None:
         """
         Record a parsing error.
 
         Arguments:
             message: A message described the error.
+                It can contain %-style placeholders, filled lazily with `args` (as in the `logging` module).
+            *args: Values for the message placeholders.
         """
+        if args:
+            message = message % args
         if self.context["obj"]:
             message = f"{self.context['obj'].path}: {message}"
         self.errors.append(message)
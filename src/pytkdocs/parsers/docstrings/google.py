@@ -136,6 +136,11 @@ class Google(Parser):
             # first non-empty line was not indented, abort
             return [], i - 1
 
+        # compute indentation prefixes once instead of once per line
+        item_indent = indent * " "
+        deeper_indent = (indent + 1) * " "
+        continuation_indent = indent * 2 * " "
+
         # start processing first item
         current_item = [lines[i][indent:]]
         i += 1
@@ -144,11 +149,11 @@ class Google(Parser):
         while i < len(lines):
             line = lines[i]
 
-            if line.startswith(indent * 2 * " "):
+            if line.startswith(continuation_indent):
                 # continuation line
                 current_item.append(line[indent * 2 :])
 
-            elif line.startswith((indent + 1) * " "):
+            elif line.startswith(deeper_indent):
                 # indent between initial and continuation: append but add error
                 cont_indent = len(line) - len(line.lstrip())
                 current_item.append(line[cont_indent:])
@@ -157,7 +162,7 @@ class Google(Parser):
                     f"should be {indent} * 2 = {indent*2} spaces, not {cont_indent}"
                 )
 
-            elif line.startswith(indent * " "):
+            elif line.startswith(item_indent):
                 # indent equal to initial one: new item
                 items.append("\n".join(current_item))
                 current_item = [line[indent:]]
@@ -205,12 +210,15 @@ class Google(Parser):
             # first non-empty line was not indented, abort
             return "", i - 1
 
+        # compute the indentation prefix once instead of once per line
+        block_indent = indent * " "
+
         # start processing first item
         block.append(lines[i].lstrip())
         i += 1
 
         # loop on next lines
-        while i < len(lines) and (lines[i].startswith(indent * " ") or is_empty_line(lines[i])):
+        while i < len(lines) and (lines[i].startswith(block_indent) or is_empty_line(lines[i])):
             block.append(lines[i][indent:])
             i += 1
 
@@ -1,8 +1,9 @@
 """This module defines functions and classes to parse docstrings into structured data."""
-from collections import defaultdict
-from dataclasses import dataclass, field
+import re
+from functools import lru_cache
 from inspect import Signature
-from typing import Any, Callable, DefaultDict, Dict, FrozenSet, List, Optional, Tuple, Type, Union, cast  # noqa: WPS235
+from io import StringIO
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union  # noqa: WPS235
 
 from pytkdocs.parsers.docstrings.base import AnnotatedObject, Attribute, Parameter, Parser, Section, empty
 
@@ -18,6 +19,9 @@ except ImportError:
 
 
 # TODO: Examples: from the documentation, I'm not sure there is a standard format for examples
+CACHE_MAX_ENTRIES = 1024
+"""Maximum number of parsed docstrings kept in a parser's cache."""
+
 PARAM_NAMES = frozenset(("param", "parameter", "arg", "argument", "key", "keyword"))
 PARAM_TYPE_NAMES = frozenset(("type",))
 ATTRIBUTE_NAMES = frozenset(("var", "ivar", "cvar"))
@@ -26,25 +30,29 @@ RETURN_NAMES = frozenset(("returns", "return"))
 RETURN_TYPE_NAMES = frozenset(("rtype",))
 EXCEPTION_NAMES = frozenset(("raises", "raise", "except", "exception"))
 
+RE_OR_SEPARATOR = re.compile(r"\s+or\s+")
+"""Regular expression to split descriptive types on the word "or"."""
 
-@dataclass(frozen=True)
-class FieldType:
-    """Maps directive names to parser functions."""
-
-    names: FrozenSet[str]
-    reader: Callable[[List[str], int], int]
+RE_INITIAL_BLANK_LINES = re.compile(r"\A(?:[^\S\n]*\n)+")
+"""Regular expression matching blank or whitespace-only lines at the start of a text."""
 
-    def matches(self, line: str) -> bool:
-        """
-        Check if a line matches the field type.
+RE_FINAL_BLANK_LINES = re.compile(r"(?:\n[^\S\n]*)+\Z")
+"""Regular expression matching blank or whitespace-only lines at the end of a text."""
 
-        Args:
-            line: Line to check against
-
-        Returns:
-            True if the line matches the field type, False otherwise.
-        """
-        return any(line.startswith(f":{name}") for name in self.names)
+FIELD_READERS: Dict[str, str] = {
+    name: reader_name
+    for names, reader_name in (
+        (PARAM_TYPE_NAMES, "_read_parameter_type"),
+        (PARAM_NAMES, "_read_parameter"),
+        (ATTRIBUTE_TYPE_NAMES, "_read_attribute_type"),
+        (ATTRIBUTE_NAMES, "_read_attribute"),
+        (EXCEPTION_NAMES, "_read_exception"),
+        (RETURN_NAMES, "_read_return"),
+        (RETURN_TYPE_NAMES, "_read_return_type"),
+    )
+    for name in names
+}
+"""Map from every directive name to the name of the method that reads it, built once at import time."""
 
 
 class AttributesDict(TypedDict):
@@ -54,11 +62,17 @@ class AttributesDict(TypedDict):
     annotation: Type  # TODO: Not positive this is correct
 
 
+_NO_ATTRIBUTES: Dict[str, AttributesDict] = {}
+"""Shared empty mapping for parse contexts without attributes, only ever read from."""
+
+
 class ParseContext:
     """Typed replacement for context dictionary."""
 
+    __slots__ = ("obj", "attributes", "signature", "annotation")
+
     obj: Any  # I think this might be pytkdos.Object & subclasses
-    attributes: DefaultDict[str, AttributesDict]
+    attributes: Dict[str, AttributesDict]
     signature: Optional[Signature]
     # Not sure real type yet. Maybe Optional[Union[Literal[Signature.empty],str,Type]]
     annotation: Any
@@ -72,144 +86,188 @@ class ParseContext:
             context: Context of parsing operation.
         """
         self.obj = context["obj"]
-        self.attributes = defaultdict(cast(Callable[[], AttributesDict], dict))
         attributes = context.get("attributes")
-        if attributes is not None:
-            self.attributes.update(attributes)
+        self.attributes = dict(attributes) if attributes else _NO_ATTRIBUTES
 
         self.signature = getattr(self.obj, "signature", None)
         self.annotation = getattr(self.obj, "type", empty)
 
 
-@dataclass
-class ParsedDirective:
-    """Directive information that has been parsed from a docstring."""
-
-    line: str
-    next_index: int
-    directive_parts: List[str]
-    value: str
-    invalid: bool = False
-
-
-@dataclass
 class ParsedValues:
     """Values parsed from the docstring to be used to produce sections."""
 
-    description: List[str] = field(default_factory=list)
-    parameters: Dict[str, Parameter] = field(default_factory=dict)
-    param_types: Dict[str, str] = field(default_factory=dict)
-    attributes: Dict[str, Attribute] = field(default_factory=dict)
-    attribute_types: Dict[str, str] = field(default_factory=dict)
-    exceptions: List[AnnotatedObject] = field(default_factory=list)
-    return_value: Optional[AnnotatedObject] = None
-    return_type: Optional[str] = None
+    __slots__ = (
+        "description",
+        "parameters",
+        "param_types",
+        "attributes",
+        "attribute_types",
+        "exceptions",
+        "return_value",
+        "return_type",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.description = StringIO()
+        self.parameters: Dict[str, Parameter] = {}
+        self.param_types: Dict[str, str] = {}
+        self.attributes: Dict[str, Attribute] = {}
+        self.attribute_types: Dict[str, str] = {}
+        self.exceptions: List[AnnotatedObject] = []
+        self.return_value: Optional[AnnotatedObject] = None
+        self.return_type: Optional[str] = None
 
 
 class RestructuredText(Parser):
     """A reStructuredText docstrings parser."""
 
-    def __init__(self) -> None:
-        """Initialize the object."""
+    _dispatch: Dict[str, Callable[["RestructuredText", str, List[str], str], None]]
+    """Map from every directive name to its unbound reader method, built once after the class body."""
+
+    def __init__(self, cache_docstrings: bool = True) -> None:
+        """
+        Initialize the object.
+
+        Arguments:
+            cache_docstrings: Whether to cache parsed docstrings, speeding up repeated parses of identical ones.
+        """
         super().__init__()
         self._typed_context = ParseContext({"obj": None})
         self._parsed_values: ParsedValues = ParsedValues()
-        # Ordering is significant so that directives like ":vartype" are checked before ":var"
-        self.field_types = [
-            FieldType(PARAM_TYPE_NAMES, self._read_parameter_type),  # type: ignore
-            FieldType(PARAM_NAMES, self._read_parameter),  # type: ignore
-            FieldType(ATTRIBUTE_TYPE_NAMES, self._read_attribute_type),  # type: ignore
-            FieldType(ATTRIBUTE_NAMES, self._read_attribute),  # type: ignore
-            FieldType(EXCEPTION_NAMES, self._read_exception),  # type: ignore
-            FieldType(RETURN_NAMES, self._read_return),  # type: ignore
-            FieldType(RETURN_TYPE_NAMES, self._read_return_type),  # type: ignore
-        ]
+        self._cache_docstrings = cache_docstrings
+        self._cache: Dict[Tuple, Tuple[List[Section], Tuple[str, ...]]] = {}
 
     def parse_sections(self, docstring: str) -> List[Section]:  # noqa: D102
         self._typed_context = ParseContext(self.context)
+
+        cache_key = self._cache_key(docstring) if self._cache_docstrings else None
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                sections, errors = cached
+                self.errors.extend(errors)
+                return _copy_sections(sections)
+
+        errors_start = len(self.errors)
         self._parsed_values = ParsedValues()
 
         lines = docstring.split("\n")
+        num_lines = len(lines)
         curr_line_index = 0
 
-        while curr_line_index < len(lines):
+        # Bind the loop invariants to locals: the loop runs once per docstring line
+        get_reader = self._dispatch.get
+        write_description = self._parsed_values.description.write
+
+        while curr_line_index < num_lines:
             line = lines[curr_line_index]
-            for field_type in self.field_types:
-                if field_type.matches(line):
-                    # https://github.com/python/mypy/issues/5485
-                    curr_line_index = field_type.reader(lines, curr_line_index)  # type: ignore
-                    break
+            reader = get_reader(_directive_name(line)) if line[:1] == ":" else None
+            if reader is not None:
+                # Consume the continuation lines of the field in the same pass
+                end_index = curr_line_index + 1
+                while end_index < num_lines and lines[end_index][:1] != ":":
+                    end_index += 1
+                consolidated = " ".join(map(str.lstrip, lines[curr_line_index:end_index])).rstrip("\n")
+                # Parse the directive once here instead of once per reader
+                directive_parts, value = self._parse_directive(consolidated)
+                if directive_parts is not None:
+                    reader(self, consolidated, directive_parts, value)
+                curr_line_index = end_index
             else:
-                self._parsed_values.description.append(line)
+                write_description(line)
+                write_description("\n")
+                curr_line_index += 1
 
-            curr_line_index += 1
+        sections = self._parsed_values_to_sections()
 
-        return self._parsed_values_to_sections()
+        if cache_key is not None:
+            if len(self._cache) >= CACHE_MAX_ENTRIES:
+                self._cache.clear()
+            self._cache[cache_key] = (_copy_sections(sections), tuple(self.errors[errors_start:]))
 
-    def _read_parameter(self, lines: List[str], start_index: int) -> int:
+        return sections
+
+    def _cache_key(self, docstring: str) -> Optional[Tuple]:
         """
-        Parse a parameter value.
+        Build a cache key identifying a docstring and its parsing context.
+
+        The key fingerprints everything that can influence the parsing result:
+        the docstring itself, the object's path (used in error messages),
+        its signature, its type annotation and the contextual attributes.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
+            docstring: The docstring to build a key for.
 
         Returns:
-            Index at which to continue parsing.
+            A hashable key, or `None` if the context cannot be fingerprinted.
+        """
+        obj = self.context.get("obj")
+        attributes = self.context.get("attributes") or {}
+        try:
+            return (
+                docstring,
+                getattr(obj, "path", None),
+                str(getattr(obj, "signature", None)),
+                str(getattr(obj, "type", empty)),
+                tuple(sorted((name, str(attr.get("annotation"))) for name, attr in attributes.items())),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def _read_parameter(self, line: str, directive_parts: List[str], value: str) -> None:
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
+        Parse a parameter value.
 
+        Arguments:
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
+        """
         directive_type = None
-        if len(parsed_directive.directive_parts) == 2:
+        if len(directive_parts) == 2:
             # no type info
-            name = parsed_directive.directive_parts[1]
-        elif len(parsed_directive.directive_parts) == 3:
-            directive_type = parsed_directive.directive_parts[1]
-            name = parsed_directive.directive_parts[2]
+            name = directive_parts[1]
+        elif len(directive_parts) == 3:
+            directive_type = directive_parts[1]
+            name = directive_parts[2]
         else:
-            self.error(f"Failed to parse field directive from '{parsed_directive.line}'")
-            return parsed_directive.next_index
+            self.error("Failed to parse field directive from '%s'", line)
+            return
 
         if name in self._parsed_values.parameters:
-            self.errors.append(f"Duplicate parameter entry for '{name}'")
-            return parsed_directive.next_index
+            self.error("Duplicate parameter entry for '%s'", name)
+            return
 
-        annotation = self._determine_param_annotation(name, directive_type)
-        default, kind = self._determine_param_details(name)
+        annotation, default, kind = self._determine_param_info(name, directive_type)
 
         self._parsed_values.parameters[name] = Parameter(
             name=name,
             annotation=annotation,
-            description=parsed_directive.value,
+            description=value,
             default=default,
             kind=kind,
         )
 
-        return parsed_directive.next_index
-
-    def _determine_param_details(self, name: str) -> Tuple[Any, Any]:
-        default = empty
-        kind = empty
-
-        if self._typed_context.signature is not None:
-            param_signature = self._typed_context.signature.parameters.get(name.lstrip("*"))
-            # an error for param_signature being none is already reported by _determine_param_annotation()
-            if param_signature is not None:
-                if param_signature.default is not empty:
-                    default = param_signature.default
-                kind = param_signature.kind
+    def _determine_param_info(self, name: str, directive_type: Optional[str]) -> Tuple[Any, Any, Any]:
+        """
+        Determine the annotation, default and kind of a parameter, in a single signature lookup.
 
-        return default, kind
+        Arguments:
+            name: The parameter name, as read from the docstring.
+            directive_type: The type read from the directive, if any.
 
-    def _determine_param_annotation(self, name: str, directive_type: Optional[str]) -> Any:
+        Returns:
+            A tuple containing the annotation, the default value and the kind of the parameter.
+        """
         # Annotation precedence:
         # - signature annotation
         # - in-line directive type
         # - "type" directive type
         # - empty
         annotation = empty
+        default = empty
+        kind = empty
 
         parsed_param_type = self._parsed_values.param_types.get(name)
         if parsed_param_type is not None:
@@ -219,40 +277,37 @@ class RestructuredText(Parser):
             annotation = directive_type
 
         if directive_type is not None and parsed_param_type is not None:
-            self.error(f"Duplicate parameter information for '{name}'")
+            self.error("Duplicate parameter information for '%s'", name)
 
         if self._typed_context.signature is not None:
-            try:
-                param_signature = self._typed_context.signature.parameters[name.lstrip("*")]
-            except KeyError:
-                self.error(f"No matching parameter for '{name}'")
+            param_signature = self._typed_context.signature.parameters.get(name.lstrip("*"))
+            if param_signature is None:
+                self.error("No matching parameter for '%s'", name)
             else:
                 if param_signature.annotation is not empty:
                     annotation = param_signature.annotation
+                if param_signature.default is not empty:
+                    default = param_signature.default
+                kind = param_signature.kind
 
-        return annotation
+        return annotation, default, kind
 
-    def _read_parameter_type(self, lines: List[str], start_index: int) -> int:
+    def _read_parameter_type(self, line: str, directive_parts: List[str], value: str) -> None:
         """
         Parse a parameter type.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
-
-        Returns:
-            Index at which to continue parsing.
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
-        param_type = _consolidate_descriptive_type(parsed_directive.value.strip())
+        param_type = _consolidate_descriptive_type(value.strip())
 
-        if len(parsed_directive.directive_parts) == 2:
-            param_name = parsed_directive.directive_parts[1]
+        if len(directive_parts) == 2:
+            param_name = directive_parts[1]
         else:
-            self.error(f"Failed to get parameter name from '{parsed_directive.line}'")
-            return parsed_directive.next_index
+            self.error("Failed to get parameter name from '%s'", line)
+            return
 
         self._parsed_values.param_types[param_name] = param_type
         param = self._parsed_values.parameters.get(param_name)
@@ -260,29 +315,22 @@ class RestructuredText(Parser):
             if param.annotation is empty:
                 param.annotation = param_type
             else:
-                self.error(f"Duplicate parameter information for '{param_name}'")
-        return parsed_directive.next_index
+                self.error("Duplicate parameter information for '%s'", param_name)
 
-    def _read_attribute(self, lines: List[str], start_index: int) -> int:
+    def _read_attribute(self, line: str, directive_parts: List[str], value: str) -> None:
         """
         Parse an attribute value.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
-
-        Returns:
-            Index at which to continue parsing.
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
-
-        if len(parsed_directive.directive_parts) == 2:
-            name = parsed_directive.directive_parts[1]
+        if len(directive_parts) == 2:
+            name = directive_parts[1]
         else:
-            self.error(f"Failed to parse field directive from '{parsed_directive.line}'")
-            return parsed_directive.next_index
+            self.error("Failed to parse field directive from '%s'", line)
+            return
 
         annotation = empty
 
@@ -295,42 +343,37 @@ class RestructuredText(Parser):
         if parsed_attribute_type is not None:
             annotation = parsed_attribute_type
 
-        context_attribute_annotation = self._typed_context.attributes[name].get("annotation")
-        if context_attribute_annotation is not None:
-            annotation = context_attribute_annotation
+        context_attribute = self._typed_context.attributes.get(name)
+        if context_attribute is not None:
+            context_attribute_annotation = context_attribute.get("annotation")
+            if context_attribute_annotation is not None:
+                annotation = context_attribute_annotation
 
         if name in self._parsed_values.attributes:
-            self.errors.append(f"Duplicate attribute entry for '{name}'")
+            self.error("Duplicate attribute entry for '%s'", name)
         else:
             self._parsed_values.attributes[name] = Attribute(
                 name=name,
                 annotation=annotation,
-                description=parsed_directive.value,
+                description=value,
             )
 
-        return parsed_directive.next_index
-
-    def _read_attribute_type(self, lines: List[str], start_index: int) -> int:
+    def _read_attribute_type(self, line: str, directive_parts: List[str], value: str) -> None:
         """
         Parse a parameter type.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
-
-        Returns:
-            Index at which to continue parsing.
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
-        attribute_type = _consolidate_descriptive_type(parsed_directive.value.strip())
+        attribute_type = _consolidate_descriptive_type(value.strip())
 
-        if len(parsed_directive.directive_parts) == 2:
-            attribute_name = parsed_directive.directive_parts[1]
+        if len(directive_parts) == 2:
+            attribute_name = directive_parts[1]
         else:
-            self.error(f"Failed to get attribute name from '{parsed_directive.line}'")
-            return parsed_directive.next_index
+            self.error("Failed to get attribute name from '%s'", line)
+            return
 
         self._parsed_values.attribute_types[attribute_name] = attribute_type
         attribute = self._parsed_values.attributes.get(attribute_name)
@@ -338,47 +381,32 @@ class RestructuredText(Parser):
             if attribute.annotation is empty:
                 attribute.annotation = attribute_type
             else:
-                self.error(f"Duplicate attribute information for '{attribute_name}'")
-        return parsed_directive.next_index
+                self.error("Duplicate attribute information for '%s'", attribute_name)
 
-    def _read_exception(self, lines: List[str], start_index: int) -> int:
+    def _read_exception(self, line: str, directive_parts: List[str], value: str) -> None:
         """
         Parse an exceptions value.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
-
-        Returns:
-            A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
-
-        if len(parsed_directive.directive_parts) == 2:
-            ex_type = parsed_directive.directive_parts[1]
-            self._parsed_values.exceptions.append(AnnotatedObject(ex_type, parsed_directive.value))
+        if len(directive_parts) == 2:
+            ex_type = directive_parts[1]
+            self._parsed_values.exceptions.append(AnnotatedObject(ex_type, value))
         else:
-            self.error(f"Failed to parse exception directive from '{parsed_directive.line}'")
-
-        return parsed_directive.next_index
+            self.error("Failed to parse exception directive from '%s'", line)
 
-    def _read_return(self, lines: List[str], start_index: int) -> int:
+    def _read_return(self, line: str, directive_parts: List[str], value: str) -> None:
         """
         Parse an return value.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
-
-        Returns:
-            Index at which to continue parsing.
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
-
         annotation = empty
         # Annotation precedence:
         # - signature annotation
@@ -392,26 +420,18 @@ class RestructuredText(Parser):
         else:
             annotation = self._typed_context.annotation
 
-        self._parsed_values.return_value = AnnotatedObject(annotation, parsed_directive.value)
-
-        return parsed_directive.next_index
+        self._parsed_values.return_value = AnnotatedObject(annotation, value)
 
-    def _read_return_type(self, lines: List[str], start_index: int) -> int:
+    def _read_return_type(self, line: str, directive_parts: List[str], value: str) -> None:
         """
         Parse an return type value.
 
         Arguments:
-            lines: The docstring lines.
-            start_index: The line number to start at.
-
-        Returns:
-            Index at which to continue parsing.
+            line: The consolidated field line.
+            directive_parts: The parts of the directive.
+            value: The value of the directive.
         """
-        parsed_directive = self._parse_directive(lines, start_index)
-        if parsed_directive.invalid:
-            return parsed_directive.next_index
-
-        return_type = _consolidate_descriptive_type(parsed_directive.value.strip())
+        return_type = _consolidate_descriptive_type(value.strip())
         self._parsed_values.return_type = return_type
         return_value = self._parsed_values.return_value
         if return_value is not None:
@@ -420,10 +440,8 @@ class RestructuredText(Parser):
             else:
                 self.error("Duplicate type information for return")
 
-        return parsed_directive.next_index
-
     def _parsed_values_to_sections(self) -> List[Section]:
-        markdown_text = "\n".join(_strip_blank_lines(self._parsed_values.description))
+        markdown_text = _strip_blank_lines(self._parsed_values.description.getvalue())
         result = [Section(Section.Type.MARKDOWN, markdown_text)]
         if self._parsed_values.parameters:
             param_values = list(self._parsed_values.parameters.values())
@@ -437,41 +455,57 @@ class RestructuredText(Parser):
             result.append(Section(Section.Type.EXCEPTIONS, self._parsed_values.exceptions))
         return result
 
-    def _parse_directive(self, lines: List[str], start_index: int) -> ParsedDirective:
-        line, next_index = _consolidate_continuation_lines(lines, start_index)
-        try:
-            _, directive, value = line.split(":", 2)
-        except ValueError:
-            self.error(f"Failed to get ':directive: value' pair from '{line}'")
-            return ParsedDirective(line, next_index, [], "", invalid=True)  # type: ignore
+    def _parse_directive(self, line: str) -> Tuple[Optional[List[str]], str]:
+        """
+        Split a consolidated field line into its directive parts and value.
 
-        value = value.strip()
-        return ParsedDirective(line, next_index, directive.split(" "), value)  # type: ignore
+        Arguments:
+            line: The consolidated field line.
 
+        Returns:
+            A tuple containing the directive parts (`None` if the line is invalid, with an error recorded)
+            and the directive value.
+        """
+        directive, separator, value = line[1:].partition(":")
+        if not separator:
+            self.error("Failed to get ':directive: value' pair from '%s'", line)
+            return None, ""
 
-def _consolidate_continuation_lines(lines: List[str], start_index: int) -> Tuple[str, int]:
-    """
-    Convert a docstring field into a single line if a line continuation exists.
+        return directive.split(" "), value.strip()
 
-    Arguments:
-        lines: The docstring lines.
-        start_index: The line number to start at.
 
-    Returns:
-        A tuple containing the continued lines as a single string and the index at which to continue parsing.
-    """
-    curr_line_index = start_index
-    block = [lines[curr_line_index].lstrip()]
+RestructuredText._dispatch = {  # noqa: WPS437
+    name: getattr(RestructuredText, reader_name) for name, reader_name in FIELD_READERS.items()
+}
 
-    # start processing after first item
-    curr_line_index += 1
-    while curr_line_index < len(lines) and not lines[curr_line_index].startswith(":"):
-        block.append(lines[curr_line_index].lstrip())
-        curr_line_index += 1
 
-    return " ".join(block).rstrip("\n"), curr_line_index - 1
+def _directive_name(line: str) -> str:
+    """
+    Extract the name of the directive starting a line.
+
+    The name is the first word after the initial colon,
+    delimited by a space or the closing colon, e.g. `"param"` in `":param foo: text"`.
 
+    Arguments:
+        line: A line starting with a colon.
 
+    Returns:
+        The directive name, possibly empty.
+    """
+    space_index = line.find(" ", 1)
+    colon_index = line.find(":", 1)
+    if space_index == -1:
+        end = colon_index
+    elif colon_index == -1:
+        end = space_index
+    else:
+        end = min(space_index, colon_index)
+    if end == -1:
+        return line[1:]
+    return line[1:end]
+
+
+@lru_cache(maxsize=512)
 def _consolidate_descriptive_type(descriptive_type: str) -> str:
     """
     Convert type descriptions with "or" into respective type signature.
@@ -485,10 +519,9 @@ def _consolidate_descriptive_type(descriptive_type: str) -> str:
     Returns:
         Type signature for descriptive type.
     """
-    types = descriptive_type.split("or")
+    types = RE_OR_SEPARATOR.split(descriptive_type.strip())
     if len(types) == 1:
         return descriptive_type
-    types = [pt.strip() for pt in types]
     if len(types) == 2:
         if types[0] == "None":
             return f"Optional[{types[1]}]"
@@ -497,28 +530,65 @@ def _consolidate_descriptive_type(descriptive_type: str) -> str:
     return f"Union[{','.join(types)}]"
 
 
-def _strip_blank_lines(lines: List[str]) -> List[str]:
+def _copy_sections(sections: List[Section]) -> List[Section]:
+    """
+    Copy a list of sections so that cached results cannot be mutated by callers.
+
+    Only the section and annotated-object wrappers are copied:
+    annotations, defaults and kinds are shared, as they are never mutated after parsing.
+
+    Arguments:
+        sections: The sections to copy.
+
+    Returns:
+        A list of new `Section` objects with equal values.
     """
-    Remove lines with no text or only whitespace characters from the start and end of the list.
+    copied = []
+    for section in sections:
+        value = section.value
+        if isinstance(value, list):
+            value = [_copy_annotated_object(item) for item in value]
+        elif isinstance(value, AnnotatedObject):
+            value = _copy_annotated_object(value)
+        copied.append(Section(section.type, value))
+    return copied
+
+
+def _copy_annotated_object(obj: AnnotatedObject) -> AnnotatedObject:
+    """
+    Copy an annotated object (or one of its subclasses).
+
+    Arguments:
+        obj: The object to copy.
+
+    Returns:
+        A new object of the same type with equal values.
+    """
+    if isinstance(obj, Parameter):
+        return Parameter(
+            name=obj.name,
+            annotation=obj.annotation,
+            description=obj.description,
+            kind=obj.kind,
+            default=obj.default,
+        )
+    if isinstance(obj, Attribute):
+        return Attribute(name=obj.name, annotation=obj.annotation, description=obj.description)
+    return AnnotatedObject(obj.annotation, obj.description)
+
+
+def _strip_blank_lines(text: str) -> str:
+    """
+    Remove lines with no text or only whitespace characters from the start and end of the text.
 
     Args:
-        lines: Lines to be stripped.
+        text: Text to be stripped.
 
     Returns:
-        A list with the same contents, with any blank lines at the start or end removed.
+        The same text, with any blank lines at the start or end removed.
     """
-    if not lines:
-        return lines
+    if not text:
+        return text
 
     # remove blank lines from the start and end
-    content_found = False
-    initial_content = 0
-    final_content = 0
-    for index, line in enumerate(lines):
-        if line == "" or line.isspace():
-            if not content_found:
-                initial_content += 1
-        else:
-            content_found = True
-            final_content = index
-    return lines[initial_content : final_content + 1]
+    return RE_FINAL_BLANK_LINES.sub("", RE_INITIAL_BLANK_LINES.sub("", text))